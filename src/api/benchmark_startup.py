@@ -0,0 +1,99 @@
+"""
+Sprint 3 - Ticket 10: Startup Benchmark
+Measures package import time in a fresh interpreter and the latency of the
+first query with and without the warm-up phase.
+
+Usage:
+    python -m src.api.benchmark_startup
+"""
+
+import subprocess
+import sys
+import time
+from typing import Dict
+
+# Entry points that must stay cheap to import
+PACKAGES = ("src.api", "src.ui", "src.ingest", "src.ingest.data", "src.api.warmup")
+
+FIRST_QUERY = "SELECT COUNT(*) FROM information_schema.tables"
+
+
+def measure_import_time(module: str, repeats: int = 5) -> float:
+    """
+    Measure the best import time of a module in a fresh interpreter.
+
+    Args:
+        module: Dotted module name to import
+        repeats: Number of fresh interpreters to start
+
+    Returns:
+        Fastest observed import time in seconds
+    """
+    code = (
+        "import time; t = time.perf_counter(); "
+        f"import {module}; print(time.perf_counter() - t)"
+    )
+    best = float("inf")
+    for _ in range(repeats):
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True, text=True, check=True
+        ).stdout
+        best = min(best, float(output.strip()))
+    return best
+
+
+def measure_first_query(db_path: str, warm: bool) -> float:
+    """
+    Measure startup-to-first-result latency in a fresh interpreter.
+
+    Args:
+        db_path: Path to DuckDB database file
+        warm: Run `warm_up()` before starting the clock
+
+    Returns:
+        Seconds from request arrival to first query result
+    """
+    code = (
+        "import time\n"
+        "from src.api import warmup\n"
+        f"if {warm!r}: warmup.warm_up({db_path!r})\n"
+        "t = time.perf_counter()\n"
+        f"warmup.get_schema_context({db_path!r})\n"
+        f"warmup.get_connection({db_path!r}).cursor().execute({FIRST_QUERY!r}).fetchall()\n"
+        "print(time.perf_counter() - t)\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True, text=True, check=True
+    ).stdout
+    return float(output.strip())
+
+
+def run_benchmark(db_path: str = "ask_your_data.db") -> Dict[str, float]:
+    """
+    Run the import-time and first-query benchmarks.
+
+    Args:
+        db_path: Path to DuckDB database file
+
+    Returns:
+        Dictionary mapping benchmark names to seconds
+    """
+    results = {f"import {module}": measure_import_time(module) for module in PACKAGES}
+    results["first query (cold)"] = measure_first_query(db_path, warm=False)
+    results["first query (warm)"] = measure_first_query(db_path, warm=True)
+    return results
+
+
+def main():
+    """Main entry point for the startup benchmark."""
+    print("=" * 70)
+    print("Startup Benchmark")
+    print("=" * 70)
+    for name, seconds in run_benchmark().items():
+        print(f"   {name:35} {seconds * 1000:>10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
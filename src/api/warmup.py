@@ -0,0 +1,141 @@
+"""
+Sprint 3 - Ticket 10: Startup Warm-up
+Preloads the shared resources used to answer queries so that the first
+request does not pay for heavy imports, connection setup or index loading.
+
+Call `warm_up()` once at process start (e.g. from the FastAPI startup hook
+or at the top of the Streamlit app) before accepting traffic.
+
+Usage:
+    python -m src.api.warmup
+"""
+
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+# Heavy modules (duckdb, faiss) are imported on first use, not at import time.
+if TYPE_CHECKING:
+    import duckdb
+
+DEFAULT_DB_PATH = "ask_your_data.db"
+DEFAULT_INDEX_PATH = "glossary/index.faiss"
+
+# Schemas whose tables are exposed to the SQL generator
+SCHEMA_CONTEXT_SCHEMAS = ("main", "raw", "dimensions")
+
+
+@lru_cache(maxsize=None)
+def get_connection(db_path: str = DEFAULT_DB_PATH) -> "duckdb.DuckDBPyConnection":
+    """
+    Return the shared read-only DuckDB connection for a database.
+
+    The connection is opened once per process and reused. Callers running
+    queries from several threads should use `conn.cursor()` on the result.
+
+    Args:
+        db_path: Path to DuckDB database file
+
+    Returns:
+        Read-only DuckDB connection
+    """
+    import duckdb
+
+    return duckdb.connect(db_path, read_only=True)
+
+
+@lru_cache(maxsize=None)
+def get_schema_context(db_path: str = DEFAULT_DB_PATH) -> Dict[str, List[Tuple[str, str]]]:
+    """
+    Load table and column metadata used as context for SQL generation.
+
+    Args:
+        db_path: Path to DuckDB database file
+
+    Returns:
+        Dictionary mapping "schema.table" to a list of (column, type) pairs
+    """
+    placeholders = ", ".join("?" for _ in SCHEMA_CONTEXT_SCHEMAS)
+    rows = get_connection(db_path).cursor().execute(f"""
+        SELECT table_schema, table_name, column_name, data_type
+        FROM information_schema.columns
+        WHERE table_schema IN ({placeholders})
+        ORDER BY table_schema, table_name, ordinal_position
+    """, list(SCHEMA_CONTEXT_SCHEMAS)).fetchall()
+
+    context: Dict[str, List[Tuple[str, str]]] = {}
+    for schema, table, column, data_type in rows:
+        context.setdefault(f"{schema}.{table}", []).append((column, data_type))
+    return context
+
+
+@lru_cache(maxsize=None)
+def get_glossary_index(index_path: str = DEFAULT_INDEX_PATH) -> Optional[Any]:
+    """
+    Load the FAISS glossary index from disk.
+
+    Args:
+        index_path: Path to the index built by `glossary/build_index.py`
+
+    Returns:
+        FAISS index, or None if the index has not been built yet
+    """
+    if not Path(index_path).exists():
+        return None
+
+    import faiss
+
+    return faiss.read_index(index_path)
+
+
+def warm_up(
+    db_path: str = DEFAULT_DB_PATH,
+    index_path: str = DEFAULT_INDEX_PATH
+) -> Dict[str, float]:
+    """
+    Preload the connection, schema context and glossary index.
+
+    Args:
+        db_path: Path to DuckDB database file
+        index_path: Path to the FAISS glossary index
+
+    Returns:
+        Dictionary mapping each warm-up step to its duration in seconds
+
+    Example:
+        >>> timings = warm_up()
+        >>> sorted(timings)
+        ['connection', 'glossary_index', 'schema_context', 'total']
+    """
+    timings: Dict[str, float] = {}
+    start = time.perf_counter()
+
+    step = time.perf_counter()
+    get_connection(db_path)
+    timings["connection"] = time.perf_counter() - step
+
+    step = time.perf_counter()
+    get_schema_context(db_path)
+    timings["schema_context"] = time.perf_counter() - step
+
+    step = time.perf_counter()
+    get_glossary_index(index_path)
+    timings["glossary_index"] = time.perf_counter() - step
+
+    timings["total"] = time.perf_counter() - start
+    return timings
+
+
+def main():
+    """Run the warm-up and print step timings."""
+    timings = warm_up()
+    print("=" * 70)
+    print("Warm-up timings")
+    print("=" * 70)
+    for name, seconds in timings.items():
+        print(f"   {name:20} {seconds * 1000:>10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,11 +6,14 @@ Creates raw tables, calendar dimension, and country mapping.
 Dependency: Ticket 1 (environment setup)
 """
 
-import duckdb
-import pandas as pd
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Dict, List
+from typing import TYPE_CHECKING, Dict, List
+
+# duckdb and pandas are imported inside the methods that need them so that
+# importing this module (e.g. from the API or UI processes) stays cheap.
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class OlistDataIngester:
@@ -43,6 +46,8 @@ class OlistDataIngester:
     
     def connect(self) -> None:
         """Establish connection to DuckDB."""
+        import duckdb
+
         self.conn = duckdb.connect(self.db_path)
         print(f"✓ Connected to DuckDB: {self.db_path}")
     
@@ -115,6 +120,8 @@ class OlistDataIngester:
         Returns:
             Number of rows created
         """
+        import pandas as pd
+
         # Generate date range
         start_date = datetime(start_year, 1, 1)
         end_date = datetime(end_year, 12, 31)
@@ -187,20 +194,32 @@ class OlistDataIngester:
             'country': ['Brazil'] * 27
         }
         
-        states_df = pd.DataFrame(states_data)
+        # 27 rows do not need a DataFrame: insert them directly
+        rows = list(zip(
+            states_data['state_code'],
+            states_data['state_name'],
+            states_data['region'],
+            states_data['country'],
+        ))
         
         # Drop table if exists
         self.conn.execute("DROP TABLE IF EXISTS dimensions.brazilian_states")
         
-        # Register and create table
-        self.conn.register('states_temp', states_df)
+        # Create and populate table
         self.conn.execute("""
-            CREATE TABLE dimensions.brazilian_states AS 
-            SELECT * FROM states_temp
+            CREATE TABLE dimensions.brazilian_states (
+                state_code VARCHAR,
+                state_name VARCHAR,
+                region VARCHAR,
+                country VARCHAR
+            )
         """)
-        self.conn.unregister('states_temp')
+        self.conn.executemany(
+            "INSERT INTO dimensions.brazilian_states VALUES (?, ?, ?, ?)",
+            rows
+        )
         
-        row_count = len(states_df)
+        row_count = len(rows)
         print(f"✓ Created Brazilian states dimension:   {row_count:>10,} rows")
         
         return row_count
@@ -211,7 +230,7 @@ class OlistDataIngester:
         # but we can document key columns here for dbt transformations
         print("✓ Index creation skipped (DuckDB uses automatic indexing)")
     
-    def get_table_summary(self) -> pd.DataFrame:
+    def get_table_summary(self) -> "pd.DataFrame":
         """
         Get summary of all tables in the database.
         
@@ -7,7 +7,6 @@ Usage:
 """
 
 import duckdb
-import pandas as pd
 
 
 def explore_database(db_path: str = "ask_your_data.db") -> None:
@@ -6,7 +6,6 @@ Dependency: src/ingest/data.py
 """
 
 import duckdb
-import pandas as pd
 from pathlib import Path
 
 